@@ -3,8 +3,10 @@ Core normalization logic for transforming aggregated data
 into a tidy, normalized format.
 """
 
+import functools
 import re
 import unicodedata
+import numpy as np
 import pandas as pd
 from typing import Optional, Tuple
 
@@ -12,6 +14,7 @@ from utils.mappings import (
     EVENT_TYPE_MAPPING,
     RESPONSE_CODE_MAPPING,
     VALID_UNIVERSES,
+    VALID_UNIVERSES_INDEX,
     EVENT_TYPES,
     RESPONSE_CODES,
     QUALITY_OK,
@@ -20,12 +23,57 @@ from utils.mappings import (
 )
 
 
+def _build_accent_table() -> dict:
+    """Build a str.translate table stripping accents from Latin letters.
+
+    Precomputed from the NFD decompositions so a single C-level translate
+    replaces the per-call decompose + filter for the common case.
+    """
+    table = {}
+    for codepoint in range(0x80, 0x250):
+        char = chr(codepoint)
+        decomposed = unicodedata.normalize("NFD", char)
+        stripped = "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
+        if stripped != char:
+            table[codepoint] = stripped
+    return table
+
+
+_ACCENT_TABLE = _build_accent_table()
+
+# Compiled once; parse_reponse_popin_suffix runs once per unique indicator
+_REPONSEPOPIN_RE = re.compile(r"^reponsepopin(?:_(.+))?$")
+
+# Matches whole underscore-delimited universe tokens in a suffix,
+# e.g. "LBP_LPM" -> ["LBP", "LPM"] but "LPX" -> []
+_UNIVERSE_TOKEN_RE = re.compile(
+    r"(?<![^_])(?:%s)(?![^_])" % "|".join(sorted(VALID_UNIVERSES, key=len, reverse=True))
+)
+
+# Partial-match fallback for response codes, longest keys first so the
+# most specific variant wins
+_RESPONSE_PARTIAL = sorted(RESPONSE_CODE_MAPPING.items(), key=lambda kv: -len(kv[0]))
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_text(text: str) -> str:
-    """Normalize text: trim, lowercase, remove accents."""
+    """Normalize text: trim, lowercase, remove accents.
+
+    Results are memoized: input cardinality is typically tiny
+    (a few dozen distinct indicator strings), so repeated calls
+    skip the Unicode decomposition entirely.
+    """
     if pd.isna(text):
         return ""
     text = str(text).strip().lower()
-    # Remove accents
+    # Pure-ASCII strings carry no accents; skip the NFD pass entirely
+    if text.isascii():
+        return text
+    # Latin diacritics resolve through the precomputed table in one C pass
+    translated = text.translate(_ACCENT_TABLE)
+    if translated.isascii():
+        return translated
+    # Remove accents the general way for anything the table does not cover
     text = unicodedata.normalize("NFD", text)
     text = "".join(c for c in text if unicodedata.category(c) != "Mn")
     return text
@@ -40,8 +88,7 @@ def parse_reponse_popin_suffix(indicateur_principal: str) -> Tuple[Optional[str]
         "ReponsePopin_LP_LBP_LPM" -> ("LP|LBP|LPM", 3)
         "ReponsePopin" -> (None, 0)
     """
-    pattern = r"^reponsepopin(?:_(.+))?$"
-    match = re.match(pattern, normalize_text(indicateur_principal))
+    match = _REPONSEPOPIN_RE.match(normalize_text(indicateur_principal))
     
     if not match:
         return None, 0
@@ -50,40 +97,47 @@ def parse_reponse_popin_suffix(indicateur_principal: str) -> Tuple[Optional[str]
     if not suffix:
         return None, 0
     
-    # Split suffix by underscore and filter valid universes
-    parts = suffix.upper().split("_")
-    valid_parts = [p for p in parts if p in VALID_UNIVERSES]
-    
+    # Keep only whole tokens that are valid universes
+    valid_parts = _UNIVERSE_TOKEN_RE.findall(suffix.upper())
+
     if not valid_parts:
         return None, 0
-    
+
     return "|".join(valid_parts), len(valid_parts)
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_response_code(indicateur: str) -> Tuple[Optional[str], bool]:
     """
     Normalize response code from indicateur field.
-    
+
+    Exact matches resolve in O(1); the partial-match scan only runs
+    on a miss, and results are memoized per unique input.
+
     Returns:
         Tuple of (normalized_code, is_valid)
     """
     normalized = normalize_text(indicateur)
-    
-    if normalized in RESPONSE_CODE_MAPPING:
-        return RESPONSE_CODE_MAPPING[normalized], True
-    
+
+    code = RESPONSE_CODE_MAPPING.get(normalized)
+    if code is not None:
+        return code, True
+
     # Try to find partial match
-    for key, value in RESPONSE_CODE_MAPPING.items():
+    for key, value in _RESPONSE_PARTIAL:
         if key in normalized or normalized in key:
             return value, True
-    
+
     return None, False
 
 
+@functools.lru_cache(maxsize=1024)
 def determine_event_type(indicateur_principal: str) -> Tuple[str, bool]:
     """
     Determine event type from Indicateur_principal.
-    
+
+    Results are memoized since the same low-cardinality values recur.
+
     Returns:
         Tuple of (event_type, is_recognized)
     """
@@ -100,15 +154,15 @@ def determine_event_type(indicateur_principal: str) -> Tuple[str, bool]:
     return "OTHER", False
 
 
-def extract_initial_universe(indicateur_principal: str, indicateur: str) -> Tuple[Optional[str], bool]:
+def extract_initial_universe(event_type: str, indicateur: str) -> Tuple[Optional[str], bool]:
     """
     Extract initial universe from indicateur when applicable.
-    
+
+    Takes the already-determined event type to avoid re-deriving it.
+
     Returns:
         Tuple of (universe, is_valid)
     """
-    event_type, _ = determine_event_type(indicateur_principal)
-    
     if event_type not in ("IDENTIFICATION", "POPIN_DISPLAYED"):
         return None, True
     
@@ -150,12 +204,11 @@ def normalize_row(row: pd.Series, measure_col: Optional[str], date_col: Optional
         "quality_detail": "",
     }
     
-    # Get measure value
+    # Get measure value; like the vectorized path, numeric strings are
+    # coerced (truncating any fractional part) and anything else becomes 1
     if measure_col and measure_col in row.index:
-        try:
-            result["measure_count"] = int(row[measure_col]) if pd.notna(row[measure_col]) else 1
-        except (ValueError, TypeError):
-            result["measure_count"] = 1
+        value = pd.to_numeric(row[measure_col], errors="coerce")
+        result["measure_count"] = int(value) if pd.notna(value) else 1
     
     quality_issues = []
     
@@ -178,14 +231,14 @@ def normalize_row(row: pd.Series, measure_col: Optional[str], date_col: Optional
             result["popin_code"] = "ASSOCIATION_LIEN"
     
     elif event_type == "IDENTIFICATION":
-        initial_universe, universe_valid = extract_initial_universe(indicateur_principal, indicateur)
+        initial_universe, universe_valid = extract_initial_universe(event_type, indicateur)
         result["initial_universe"] = initial_universe
         
         if not universe_valid and initial_universe:
             quality_issues.append(f"Unknown universe: {initial_universe}")
     
     elif event_type == "POPIN_DISPLAYED":
-        initial_universe, universe_valid = extract_initial_universe(indicateur_principal, indicateur)
+        initial_universe, universe_valid = extract_initial_universe(event_type, indicateur)
         result["initial_universe"] = initial_universe
         
         normalized_principal = normalize_text(indicateur_principal)
@@ -199,22 +252,130 @@ def normalize_row(row: pd.Series, measure_col: Optional[str], date_col: Optional
         if not event_recognized:
             quality_issues.append(f"Unrecognized event type from: {indicateur_principal}")
     
-    # Set quality flags
+    # Set quality flags: errors (unrecognized codes/events) outrank warnings
     if quality_issues:
-        # Check if it's a warning or error
-        has_unknown_universe = any("Unknown universe" in issue for issue in quality_issues)
-        has_unrecognized = any("Unrecognized" in issue for issue in quality_issues)
-        
-        if has_unrecognized:
-            result["quality_flag"] = QUALITY_ERROR
-        elif has_unknown_universe:
+        if event_type in ("IDENTIFICATION", "POPIN_DISPLAYED"):
             result["quality_flag"] = QUALITY_WARNING
-        
+        else:
+            result["quality_flag"] = QUALITY_ERROR
+
         result["quality_detail"] = "; ".join(quality_issues)
     
     return result
 
 
+def _derive_event_columns(ip: pd.Series, ind: pd.Series) -> dict:
+    """
+    Run the normalization rules over (Indicateur_principal, indicateur) pairs.
+
+    normalize_dataframe calls this with deduplicated pairs and broadcasts
+    the results back to all rows by integer code, so the rule cascade runs
+    once per distinct pair regardless of row count.
+
+    Returns:
+        Dict mapping derived column names to numpy arrays.
+    """
+    # Normalize text once per unique value and map back (cardinality is tiny);
+    # astype(str) keeps the .str accessor usable on empty input
+    norm_map = {value: normalize_text(value) for value in pd.concat([ip, ind]).unique()}
+    ip_norm = ip.map(norm_map).astype(str)
+    ind_norm = ind.map(norm_map).astype(str)
+
+    # Event type: ReponsePopin pattern wins, then direct mapping, then OTHER
+    is_popin_response = ip_norm.str.startswith("reponsepopin")
+    event_type = (
+        ip_norm.map(EVENT_TYPE_MAPPING)
+        .where(~is_popin_response, "POPIN_RESPONSE")
+        .fillna("OTHER")
+    )
+    is_identification = event_type == "IDENTIFICATION"
+    is_popin_displayed = event_type == "POPIN_DISPLAYED"
+    is_other = event_type == "OTHER"
+
+    # Response codes: resolve once per unique indicateur on POPIN_RESPONSE rows
+    response_code = pd.Series(None, index=ip.index, dtype=object)
+    response_valid = pd.Series(True, index=ip.index, dtype=bool)
+    popin_ind = ind[is_popin_response]
+    if len(popin_ind) > 0:
+        resolved = {value: normalize_response_code(value) for value in popin_ind.unique()}
+        response_code[is_popin_response] = popin_ind.map(lambda v: resolved[v][0])
+        response_valid[is_popin_response] = popin_ind.map(lambda v: resolved[v][1])
+
+    # Universe context: extract the suffix and find valid tokens in one regex
+    # pass. fillna("") keeps the dtype string even when no value matched
+    # (an all-NaN extract comes back float64 and breaks the .str accessor);
+    # empty suffixes simply yield no tokens
+    suffix = ip_norm.str.extract(_REPONSEPOPIN_RE, expand=False).fillna("")
+    tokens = suffix.str.upper().str.findall(_UNIVERSE_TOKEN_RE)
+    universe_count = tokens.str.len().astype("int64")
+    universe_context = tokens.str.join("|")
+    universe_context = universe_context.where(
+        universe_context.notna() & (universe_context != ""), None
+    ).astype(object)
+
+    # Remaining columns are filled into preallocated numpy arrays; boolean
+    # masks index straight into them without per-row dict or Series overhead
+    n = len(ip)
+    ip_values = ip.to_numpy()
+    ind_values = ind.to_numpy()
+
+    # Popin codes
+    has_association = (
+        ip_norm.str.contains("association", regex=False)
+        | ind_norm.str.contains("association", regex=False)
+    )
+    popin_code = np.full(n, None, dtype=object)
+    popin_code[(is_popin_response & has_association).to_numpy()] = "ASSOCIATION_LIEN"
+    is_primo = is_popin_displayed & ip_norm.str.contains("primo", regex=False)
+    popin_code[is_primo.to_numpy()] = "PRIMO_IDENTIFICATION"
+
+    # Initial universe for identification / popin displayed events
+    needs_universe = is_identification | is_popin_displayed
+    ind_upper = ind.str.strip().str.upper()
+    has_universe = (needs_universe & (ind_upper != "")).to_numpy()
+    initial_universe = np.full(n, None, dtype=object)
+    initial_universe[has_universe] = ind_upper.to_numpy()[has_universe]
+    universe_known = ind_upper.isin(VALID_UNIVERSES_INDEX)
+
+    # Quality flags (masks are disjoint: each event type raises at most
+    # one issue per row)
+    bad_response = (is_popin_response & ~response_valid & (ind != "")).to_numpy()
+    unknown_universe = (needs_universe & ~universe_known).to_numpy() & has_universe
+    unrecognized = is_other.to_numpy()
+
+    quality_flag = np.select(
+        [bad_response, unknown_universe, unrecognized],
+        [QUALITY_ERROR, QUALITY_WARNING, QUALITY_ERROR],
+        default=QUALITY_OK,
+    )
+    quality_detail = np.full(n, "", dtype=object)
+    quality_detail[bad_response] = "Unrecognized response_code: " + ind_values[bad_response]
+    quality_detail[unknown_universe] = "Unknown universe: " + initial_universe[unknown_universe]
+    quality_detail[unrecognized] = "Unrecognized event type from: " + ip_values[unrecognized]
+
+    return {
+        "event_type": event_type.to_numpy(),
+        "popin_code": popin_code,
+        "response_code": response_code.to_numpy(),
+        "initial_universe": initial_universe,
+        "universe_context": universe_context.to_numpy(),
+        "universe_count": universe_count.to_numpy(),
+        "quality_flag": quality_flag,
+        "quality_detail": quality_detail,
+    }
+
+
+def _categorical_from_pairs(values: np.ndarray, pair_codes: np.ndarray) -> pd.Categorical:
+    """
+    Dictionary-encode a per-unique-pair array straight into a categorical.
+
+    Factorizing the small unique-value array and broadcasting integer codes
+    skips the full-column object scan an astype('category') would do.
+    """
+    unique_codes, categories = pd.factorize(values)
+    return pd.Categorical.from_codes(unique_codes[pair_codes], categories)
+
+
 def normalize_dataframe(
     df: pd.DataFrame,
     measure_col: Optional[str] = None,
@@ -234,16 +395,57 @@ def normalize_dataframe(
     # Validate required columns
     required_cols = ["Indicateur_principal", "indicateur"]
     missing_cols = [col for col in required_cols if col not in df.columns]
-    
+
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
-    
-    # Normalize each row
-    normalized_rows = []
-    for _, row in df.iterrows():
-        normalized_rows.append(normalize_row(row, measure_col, date_col))
-    
-    return pd.DataFrame(normalized_rows)
+
+    # Source columns as strings (NaN -> "")
+    ip = df["Indicateur_principal"].where(df["Indicateur_principal"].notna(), "").astype(str)
+    ind = df["indicateur"].where(df["indicateur"].notna(), "").astype(str)
+    n = len(df)
+
+    # Event date
+    if date_col and date_col in df.columns:
+        event_date = df[date_col]
+    else:
+        event_date = pd.Series(None, index=df.index, dtype=object)
+
+    # Measure value: numeric strings are coerced, truncating any fractional
+    # part ("12.5" -> 12); non-numeric or missing values fall back to 1
+    if measure_col and measure_col in df.columns:
+        measure_count = pd.to_numeric(df[measure_col], errors="coerce").fillna(1).astype("int64")
+    else:
+        measure_count = pd.Series(1, index=df.index, dtype="int64")
+
+    # All other columns depend only on the (ip, ind) pair, which repeats
+    # heavily in aggregated input: factorize the pairs to integer codes,
+    # run the rule cascade once per distinct pair, and broadcast back
+    pair_codes = pd.factorize(ip.str.cat(ind, sep="\x1f"))[0]
+    pair_count = int(pair_codes.max()) + 1 if n > 0 else 0
+    first_seen = np.empty(pair_count, dtype=np.intp)
+    first_seen[pair_codes[::-1]] = np.arange(n - 1, -1, -1)
+
+    derived = _derive_event_columns(
+        ip.iloc[first_seen].reset_index(drop=True),
+        ind.iloc[first_seen].reset_index(drop=True),
+    )
+
+    # Low-cardinality code columns go straight to category dtype: smaller
+    # memory footprint and faster downstream map/groupby in the schema build
+    return pd.DataFrame({
+        "event_date": event_date,
+        "event_type": _categorical_from_pairs(derived["event_type"], pair_codes),
+        "popin_code": _categorical_from_pairs(derived["popin_code"], pair_codes),
+        "response_code": _categorical_from_pairs(derived["response_code"], pair_codes),
+        "initial_universe": _categorical_from_pairs(derived["initial_universe"], pair_codes),
+        "universe_context": derived["universe_context"][pair_codes],
+        "universe_count": derived["universe_count"][pair_codes],
+        "measure_count": measure_count,
+        "source_indicateur_principal": ip,
+        "source_indicateur": ind,
+        "quality_flag": _categorical_from_pairs(derived["quality_flag"], pair_codes),
+        "quality_detail": derived["quality_detail"][pair_codes],
+    }).reset_index(drop=True)
 
 
 def get_quality_summary(df: pd.DataFrame) -> dict:
@@ -254,10 +456,11 @@ def get_quality_summary(df: pd.DataFrame) -> dict:
         Dictionary with quality statistics.
     """
     total = len(df)
-    ok_count = len(df[df["quality_flag"] == QUALITY_OK])
-    warning_count = len(df[df["quality_flag"] == QUALITY_WARNING])
-    error_count = len(df[df["quality_flag"] == QUALITY_ERROR])
-    
+    counts = df["quality_flag"].value_counts()
+    ok_count = int(counts.get(QUALITY_OK, 0))
+    warning_count = int(counts.get(QUALITY_WARNING, 0))
+    error_count = int(counts.get(QUALITY_ERROR, 0))
+
     return {
         "total_rows": total,
         "ok_count": ok_count,
@@ -5,12 +5,17 @@ Star schema generation for normalized event data.
 import io
 import zipfile
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from typing import Dict
 
 from utils.mappings import (
     EVENT_TYPES,
     RESPONSE_CODES,
     VALID_UNIVERSES,
+    EventTypeCode,
+    ResponseCode,
+    UniverseCode,
 )
 
 
@@ -58,48 +63,39 @@ def create_dim_popin() -> pd.DataFrame:
     return pd.DataFrame(data)
 
 
+# Code -> dimension ID lookups, shared by the scalar getters and the
+# vectorized fact table build; the integer values come from the IntEnum
+# definitions so dimension IDs have a single source of truth
+_EVENT_TYPE_IDS = {member.name: member.value for member in EventTypeCode}
+
+_RESPONSE_IDS = {member.name: member.value for member in ResponseCode}
+
+_UNIVERSE_IDS = {member.name: member.value for member in UniverseCode}
+
+_POPIN_IDS = {
+    "ASSOCIATION_LIEN": 1,
+    "PRIMO_IDENTIFICATION": 2,
+}
+
+
 def get_event_type_id(event_type: str) -> int:
     """Map event type code to dimension ID."""
-    mapping = {
-        "IDENTIFICATION": 1,
-        "POPIN_DISPLAYED": 2,
-        "POPIN_RESPONSE": 3,
-        "LINK_CREATED": 4,
-        "LINK_VALIDATED": 5,
-        "LINK_DELETED": 6,
-        "OTHER": 7,
-    }
-    return mapping.get(event_type, 7)
+    return _EVENT_TYPE_IDS.get(event_type, 7)
 
 
 def get_response_id(response_code: str) -> int:
     """Map response code to dimension ID."""
-    mapping = {
-        "ASSOCIATION": 1,
-        "PEUT_ETRE": 2,
-        "REFUS": 3,
-        "CLOSE": 4,
-    }
-    return mapping.get(response_code, 0) if response_code else 0
+    return _RESPONSE_IDS.get(response_code, 0) if response_code else 0
 
 
 def get_universe_id(universe_code: str) -> int:
     """Map universe code to dimension ID."""
-    mapping = {
-        "LBP": 1,
-        "LP": 2,
-        "LPM": 3,
-    }
-    return mapping.get(universe_code, 0) if universe_code else 0
+    return _UNIVERSE_IDS.get(universe_code, 0) if universe_code else 0
 
 
 def get_popin_id(popin_code: str) -> int:
     """Map popin code to dimension ID."""
-    mapping = {
-        "ASSOCIATION_LIEN": 1,
-        "PRIMO_IDENTIFICATION": 2,
-    }
-    return mapping.get(popin_code, 0) if popin_code else 0
+    return _POPIN_IDS.get(popin_code, 0) if popin_code else 0
 
 
 def create_fact_event(normalized_df: pd.DataFrame) -> pd.DataFrame:
@@ -108,35 +104,23 @@ def create_fact_event(normalized_df: pd.DataFrame) -> pd.DataFrame:
     
     Converts codes to foreign key IDs for dimensional model.
     """
-    fact_df = normalized_df.copy()
-    
-    # Add surrogate key
-    fact_df.insert(0, "event_sk", range(1, len(fact_df) + 1))
-    
-    # Add foreign keys
-    fact_df["event_type_fk"] = fact_df["event_type"].apply(get_event_type_id)
-    fact_df["response_fk"] = fact_df["response_code"].apply(get_response_id)
-    fact_df["initial_universe_fk"] = fact_df["initial_universe"].apply(get_universe_id)
-    fact_df["popin_fk"] = fact_df["popin_code"].apply(get_popin_id)
-    
-    # Select and reorder columns for fact table
-    fact_columns = [
-        "event_sk",
-        "event_date",
-        "event_type_fk",
-        "popin_fk",
-        "response_fk",
-        "initial_universe_fk",
-        "universe_context",
-        "universe_count",
-        "measure_count",
-        "source_indicateur_principal",
-        "source_indicateur",
-        "quality_flag",
-        "quality_detail",
-    ]
-    
-    return fact_df[fact_columns]
+    # Assemble directly from column references: no full-frame copy, and the
+    # FK getters run once per category of each code column
+    return pd.DataFrame({
+        "event_sk": range(1, len(normalized_df) + 1),
+        "event_date": normalized_df["event_date"],
+        "event_type_fk": normalized_df["event_type"].map(get_event_type_id).astype("int64"),
+        "popin_fk": normalized_df["popin_code"].map(get_popin_id).astype("int64"),
+        "response_fk": normalized_df["response_code"].map(get_response_id).astype("int64"),
+        "initial_universe_fk": normalized_df["initial_universe"].map(get_universe_id).astype("int64"),
+        "universe_context": normalized_df["universe_context"],
+        "universe_count": normalized_df["universe_count"],
+        "measure_count": normalized_df["measure_count"],
+        "source_indicateur_principal": normalized_df["source_indicateur_principal"],
+        "source_indicateur": normalized_df["source_indicateur"],
+        "quality_flag": normalized_df["quality_flag"],
+        "quality_detail": normalized_df["quality_detail"],
+    })
 
 
 def create_bridge_event_universe(normalized_df: pd.DataFrame) -> pd.DataFrame:
@@ -145,23 +129,17 @@ def create_bridge_event_universe(normalized_df: pd.DataFrame) -> pd.DataFrame:
     
     Parses universe_context to create individual relationships.
     """
-    bridge_rows = []
-    
-    for idx, row in normalized_df.iterrows():
-        event_sk = idx + 1
-        universe_context = row.get("universe_context")
-        
-        if universe_context:
-            universes = universe_context.split("|")
-            for universe in universes:
-                universe_id = get_universe_id(universe.strip())
-                if universe_id > 0:
-                    bridge_rows.append({
-                        "event_sk": event_sk,
-                        "universe_fk": universe_id,
-                    })
-    
-    return pd.DataFrame(bridge_rows)
+    context = normalized_df["universe_context"].reset_index(drop=True)
+    context = context[context.notna() & (context != "")]
+
+    # Explode "LBP|LPM" -> one row per universe, keyed by positional event_sk
+    universes = context.str.split("|").explode().str.strip()
+    universe_fk = universes.map(_UNIVERSE_IDS).dropna().astype("int64")
+
+    return pd.DataFrame({
+        "event_sk": universe_fk.index + 1,
+        "universe_fk": universe_fk.to_numpy(),
+    })
 
 
 def generate_star_schema(normalized_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
@@ -196,13 +174,16 @@ def create_zip_archive(tables: Dict[str, pd.DataFrame], format: str = "csv") ->
     
     with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
         for name, df in tables.items():
+            # Stream each table straight into the archive entry instead of
+            # materializing the full serialized blob first
             if format == "parquet":
-                table_buffer = io.BytesIO()
-                df.to_parquet(table_buffer, index=False, engine="pyarrow")
-                zf.writestr(f"{name}.parquet", table_buffer.getvalue())
+                with zf.open(f"{name}.parquet", "w") as entry:
+                    df.to_parquet(entry, index=False, engine="pyarrow")
             else:
-                csv_content = df.to_csv(index=False)
-                zf.writestr(f"{name}.csv", csv_content)
+                with zf.open(f"{name}.csv", "w", force_zip64=True) as entry:
+                    # Arrow's CSV writer formats cells in C++ instead of
+                    # pandas' per-cell Python formatting
+                    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), entry)
     
     buffer.seek(0)
     return buffer.getvalue()
@@ -7,11 +7,19 @@ into a clean, tidy format with proper separation of concerns.
 
 import io
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import streamlit as st
 
 from services.normalizer import normalize_dataframe, get_quality_summary
 from services.schema import generate_star_schema, create_zip_archive
-from utils.mappings import MEASURE_COLUMN_CANDIDATES, DATE_COLUMN_CANDIDATES
+from utils.mappings import (
+    MEASURE_COLUMN_CANDIDATES,
+    MEASURE_COLUMN_RE,
+    DATE_COLUMN_CANDIDATES,
+    DATE_COLUMN_RE,
+)
 from utils.columns import normalize_columns, format_column_mapping_message
 
 
@@ -23,29 +31,48 @@ st.set_page_config(
 )
 
 
-def detect_columns(df: pd.DataFrame, candidates: list) -> list:
+def detect_columns(df: pd.DataFrame, candidates: list, candidates_re=None) -> list:
     """Auto-detect columns matching candidate names."""
-    columns = df.columns.str.lower().tolist()
-    matches = []
-    for candidate in candidates:
-        for col in df.columns:
-            if candidate in col.lower():
-                matches.append(col)
+    # One scan over the columns, bucketed so candidate priority order and
+    # de-duplication are preserved in the flattened result. The compiled
+    # alternation rules out non-matching columns in a single regex pass.
+    matches_by_candidate = {candidate: [] for candidate in candidates}
+    for col in df.columns:
+        col_lower = col.lower()
+        if candidates_re is not None and not candidates_re.search(col_lower):
+            continue
+        for candidate in candidates:
+            if candidate in col_lower:
+                matches_by_candidate[candidate].append(col)
+    matches = [col for cols in matches_by_candidate.values() for col in cols]
     return list(dict.fromkeys(matches))  # Remove duplicates while preserving order
 
 
-def load_file(uploaded_file) -> pd.DataFrame:
-    """Load uploaded file as DataFrame."""
-    file_name = uploaded_file.name.lower()
-    
-    if file_name.endswith(".parquet"):
-        return pd.read_parquet(uploaded_file, engine="pyarrow")
-    elif file_name.endswith(".csv"):
-        return pd.read_csv(uploaded_file)
+@st.cache_data(show_spinner=False)
+def load_file(file_bytes: bytes, file_name: str) -> pd.DataFrame:
+    """Load uploaded file content as DataFrame, cached on the raw bytes."""
+    name_lower = file_name.lower()
+
+    if name_lower.endswith(".parquet"):
+        return pd.read_parquet(io.BytesIO(file_bytes), engine="pyarrow")
+    elif name_lower.endswith(".csv"):
+        return pd.read_csv(io.BytesIO(file_bytes))
     else:
         raise ValueError(f"Unsupported file type: {file_name}")
 
 
+@st.cache_data(show_spinner=False)
+def run_normalization(df: pd.DataFrame, measure_col, date_col) -> pd.DataFrame:
+    """Cached wrapper so widget-only reruns skip re-normalizing."""
+    return normalize_dataframe(df, measure_col, date_col)
+
+
+@st.cache_data(show_spinner=False)
+def build_star_schema(normalized_df: pd.DataFrame) -> dict:
+    """Cached wrapper so reruns reuse the generated star schema tables."""
+    return generate_star_schema(normalized_df)
+
+
 def main():
     # Header
     st.title("🔄 Normalize Data")
@@ -87,7 +114,7 @@ def main():
     
     # Load and validate file
     try:
-        df = load_file(uploaded_file)
+        df = load_file(uploaded_file.getvalue(), uploaded_file.name)
     except Exception as e:
         st.error(f"❌ Error loading file: {e}")
         return
@@ -129,7 +156,7 @@ def main():
     
     with config_col1:
         # Detect measure columns
-        measure_candidates = detect_columns(df, MEASURE_COLUMN_CANDIDATES)
+        measure_candidates = detect_columns(df, MEASURE_COLUMN_CANDIDATES, MEASURE_COLUMN_RE)
         measure_options = ["(none - use default: 1)"] + measure_candidates + [c for c in df.columns if c not in measure_candidates]
         
         measure_col = st.selectbox(
@@ -142,7 +169,7 @@ def main():
     
     with config_col2:
         # Detect date columns
-        date_candidates = detect_columns(df, DATE_COLUMN_CANDIDATES)
+        date_candidates = detect_columns(df, DATE_COLUMN_CANDIDATES, DATE_COLUMN_RE)
         date_options = ["(none)"] + date_candidates + [c for c in df.columns if c not in date_candidates]
         
         date_col = st.selectbox(
@@ -167,7 +194,7 @@ def main():
         with st.spinner("Processing..."):
             try:
                 # Normalize data
-                normalized_df = normalize_dataframe(df, measure_col, date_col)
+                normalized_df = run_normalization(df, measure_col, date_col)
                 
                 # Store in session state
                 st.session_state["normalized_df"] = normalized_df
@@ -221,7 +248,7 @@ def main():
         if "Star schema" in output_format:
             # Generate star schema
             with st.spinner("Generating star schema..."):
-                tables = generate_star_schema(normalized_df)
+                tables = build_star_schema(normalized_df)
                 zip_bytes = create_zip_archive(tables, format="csv")
             
             with download_col1:
@@ -239,11 +266,16 @@ def main():
                     st.markdown(f"**{name}** ({len(table_df)} rows)")
                     st.dataframe(table_df.head(5), use_container_width=True)
         else:
-            # MVP tidy output
-            csv_data = normalized_df.to_csv(index=False)
-            parquet_buffer = io.BytesIO()
-            normalized_df.to_parquet(parquet_buffer, index=False, engine="pyarrow")
-            parquet_data = parquet_buffer.getvalue()
+            # MVP tidy output: convert to Arrow once, share across both writers
+            table = pa.Table.from_pandas(normalized_df, preserve_index=False)
+
+            csv_buffer = pa.BufferOutputStream()
+            pacsv.write_csv(table, csv_buffer)
+            csv_data = csv_buffer.getvalue().to_pybytes()
+
+            parquet_buffer = pa.BufferOutputStream()
+            pq.write_table(table, parquet_buffer, compression="zstd", compression_level=3)
+            parquet_data = parquet_buffer.getvalue().to_pybytes()
             
             with download_col1:
                 st.download_button(
@@ -28,6 +28,9 @@ class TestCleanColumnName:
     def test_replace_multiple_separators(self):
         assert clean_column_name("my - column") == "my_column"
 
+    def test_replace_unicode_whitespace(self):
+        assert clean_column_name("Indicateur\xa0principal") == "Indicateur_principal"
+
 
 class TestNormalizeColumns:
     """Tests for normalize_columns function."""
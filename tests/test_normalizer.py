@@ -0,0 +1,167 @@
+"""
+Tests for the core normalization pipeline.
+"""
+
+import pandas as pd
+import pytest
+
+from services.normalizer import (
+    normalize_text,
+    parse_reponse_popin_suffix,
+    normalize_response_code,
+    determine_event_type,
+    normalize_dataframe,
+    get_quality_summary,
+)
+
+
+class TestNormalizeText:
+    """Tests for normalize_text function."""
+
+    def test_trim_and_lowercase(self):
+        assert normalize_text("  Identification  ") == "identification"
+
+    def test_remove_accents(self):
+        assert normalize_text("Peut-être") == "peut-etre"
+
+    def test_nan_returns_empty(self):
+        assert normalize_text(float("nan")) == ""
+
+
+class TestParseReponsePopinSuffix:
+    """Tests for parse_reponse_popin_suffix function."""
+
+    def test_two_universes(self):
+        assert parse_reponse_popin_suffix("ReponsePopin_LBP_LPM") == ("LBP|LPM", 2)
+
+    def test_three_universes(self):
+        assert parse_reponse_popin_suffix("ReponsePopin_LP_LBP_LPM") == ("LP|LBP|LPM", 3)
+
+    def test_no_suffix(self):
+        assert parse_reponse_popin_suffix("ReponsePopin") == (None, 0)
+
+    def test_invalid_suffix(self):
+        assert parse_reponse_popin_suffix("ReponsePopin_XYZ") == (None, 0)
+
+
+class TestNormalizeResponseCode:
+    """Tests for normalize_response_code function."""
+
+    def test_exact_match(self):
+        assert normalize_response_code("Association") == ("ASSOCIATION", True)
+
+    def test_accented_variant(self):
+        assert normalize_response_code("Peut-être") == ("PEUT_ETRE", True)
+
+    def test_unknown_code(self):
+        assert normalize_response_code("Inconnu") == (None, False)
+
+
+class TestDetermineEventType:
+    """Tests for determine_event_type function."""
+
+    def test_identification(self):
+        assert determine_event_type("Identification") == ("IDENTIFICATION", True)
+
+    def test_reponse_popin(self):
+        assert determine_event_type("ReponsePopin_LBP") == ("POPIN_RESPONSE", True)
+
+    def test_unknown(self):
+        assert determine_event_type("Mystery") == ("OTHER", False)
+
+
+class TestNormalizeDataframe:
+    """Tests for normalize_dataframe function."""
+
+    def make_df(self):
+        return pd.DataFrame({
+            "Indicateur_principal": [
+                "Identification",
+                "ReponsePopin_LBP_LPM",
+                "Primo_Identification_Popin",
+                "Mystery_Event",
+            ],
+            "indicateur": ["LBP", "Association", "XX", "??"],
+            "valeur": [100, 50, 60, 10],
+        })
+
+    def test_missing_columns_raises(self):
+        with pytest.raises(ValueError, match="Missing required columns"):
+            normalize_dataframe(pd.DataFrame({"indicateur": ["x"]}))
+
+    def test_event_types(self):
+        result = normalize_dataframe(self.make_df())
+        assert list(result["event_type"]) == [
+            "IDENTIFICATION", "POPIN_RESPONSE", "POPIN_DISPLAYED", "OTHER",
+        ]
+
+    def test_popin_response_fields(self):
+        result = normalize_dataframe(self.make_df())
+        row = result.iloc[1]
+        assert row["response_code"] == "ASSOCIATION"
+        assert row["popin_code"] == "ASSOCIATION_LIEN"
+        assert row["universe_context"] == "LBP|LPM"
+        assert row["universe_count"] == 2
+
+    def test_primo_popin_code(self):
+        result = normalize_dataframe(self.make_df())
+        assert result.iloc[2]["popin_code"] == "PRIMO_IDENTIFICATION"
+
+    def test_measure_column(self):
+        result = normalize_dataframe(self.make_df(), measure_col="valeur")
+        assert list(result["measure_count"]) == [100, 50, 60, 10]
+
+    def test_measure_defaults_to_one(self):
+        result = normalize_dataframe(self.make_df())
+        assert list(result["measure_count"]) == [1, 1, 1, 1]
+
+    def test_measure_coerces_strings(self):
+        df = self.make_df()
+        df["valeur"] = ["100", "12.5", "abc", None]
+        result = normalize_dataframe(df, measure_col="valeur")
+        assert list(result["measure_count"]) == [100, 12, 1, 1]
+
+    def test_quality_flags(self):
+        result = normalize_dataframe(self.make_df())
+        assert result.iloc[0]["quality_flag"] == "OK"
+        assert result.iloc[2]["quality_flag"] == "WARNING"
+        assert "Unknown universe" in result.iloc[2]["quality_detail"]
+        assert result.iloc[3]["quality_flag"] == "ERROR"
+        assert "Unrecognized event type" in result.iloc[3]["quality_detail"]
+
+    def test_no_reponse_popin_rows(self):
+        df = pd.DataFrame({
+            "Indicateur_principal": ["Identification", "Creation_Lien"],
+            "indicateur": ["LBP", "LP"],
+        })
+        result = normalize_dataframe(df)
+        assert list(result["event_type"]) == ["IDENTIFICATION", "LINK_CREATED"]
+        assert list(result["universe_count"]) == [0, 0]
+        assert result["universe_context"].isna().all()
+
+    def test_matches_sample_output(self):
+        df = pd.read_csv("sample_input.csv")
+        result = normalize_dataframe(df, measure_col="valeur")
+        golden = pd.read_csv("sample_output_normalized.csv")
+        assert list(result["event_type"]) == list(golden["event_type"])
+        assert list(result["measure_count"]) == list(golden["measure_count"])
+        assert list(result["quality_flag"]) == list(golden["quality_flag"])
+
+
+class TestGetQualitySummary:
+    """Tests for get_quality_summary function."""
+
+    def test_counts_and_percentages(self):
+        df = pd.DataFrame({"quality_flag": ["OK", "OK", "WARNING", "ERROR"]})
+        summary = get_quality_summary(df)
+        assert summary["total_rows"] == 4
+        assert summary["ok_count"] == 2
+        assert summary["warning_count"] == 1
+        assert summary["error_count"] == 1
+        assert summary["ok_pct"] == 50.0
+
+    def test_empty_dataframe(self):
+        df = pd.DataFrame({"quality_flag": []})
+        summary = get_quality_summary(df)
+        assert summary["total_rows"] == 0
+        assert summary["ok_pct"] == 0
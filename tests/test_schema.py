@@ -0,0 +1,113 @@
+"""
+Tests for star schema generation.
+"""
+
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+from services.normalizer import normalize_dataframe
+from services.schema import (
+    get_event_type_id,
+    get_response_id,
+    get_universe_id,
+    get_popin_id,
+    create_fact_event,
+    create_bridge_event_universe,
+    generate_star_schema,
+    create_zip_archive,
+)
+
+
+@pytest.fixture
+def normalized_df():
+    df = pd.DataFrame({
+        "Indicateur_principal": [
+            "Identification",
+            "ReponsePopin_LBP_LPM",
+            "Creation_Lien",
+        ],
+        "indicateur": ["LBP", "Association", "LP"],
+        "valeur": [100, 50, 25],
+    })
+    return normalize_dataframe(df, measure_col="valeur")
+
+
+class TestDimensionLookups:
+    """Tests for scalar dimension ID getters."""
+
+    def test_event_type_id(self):
+        assert get_event_type_id("IDENTIFICATION") == 1
+        assert get_event_type_id("UNKNOWN") == 7
+
+    def test_response_id(self):
+        assert get_response_id("ASSOCIATION") == 1
+        assert get_response_id(None) == 0
+
+    def test_universe_id(self):
+        assert get_universe_id("LBP") == 1
+        assert get_universe_id("") == 0
+
+    def test_popin_id(self):
+        assert get_popin_id("ASSOCIATION_LIEN") == 1
+        assert get_popin_id(None) == 0
+
+
+class TestCreateFactEvent:
+    """Tests for create_fact_event function."""
+
+    def test_surrogate_keys_sequential(self, normalized_df):
+        fact = create_fact_event(normalized_df)
+        assert list(fact["event_sk"]) == [1, 2, 3]
+
+    def test_foreign_keys(self, normalized_df):
+        fact = create_fact_event(normalized_df)
+        assert list(fact["event_type_fk"]) == [1, 3, 4]
+        assert list(fact["response_fk"]) == [0, 1, 0]
+        assert list(fact["initial_universe_fk"]) == [1, 0, 0]
+        assert list(fact["popin_fk"]) == [0, 1, 0]
+
+
+class TestCreateBridgeEventUniverse:
+    """Tests for create_bridge_event_universe function."""
+
+    def test_explodes_universe_context(self, normalized_df):
+        bridge = create_bridge_event_universe(normalized_df)
+        assert list(bridge["event_sk"]) == [2, 2]
+        assert list(bridge["universe_fk"]) == [1, 3]
+
+
+class TestGenerateStarSchema:
+    """Tests for generate_star_schema function."""
+
+    def test_all_tables_present(self, normalized_df):
+        tables = generate_star_schema(normalized_df)
+        assert set(tables) == {
+            "fact_event",
+            "dim_event_type",
+            "dim_universe",
+            "dim_response",
+            "dim_popin",
+            "bridge_event_universe",
+        }
+
+
+class TestCreateZipArchive:
+    """Tests for create_zip_archive function."""
+
+    def test_csv_archive(self, normalized_df):
+        tables = generate_star_schema(normalized_df)
+        zip_bytes = create_zip_archive(tables, format="csv")
+        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+            names = zf.namelist()
+            assert "fact_event.csv" in names
+            fact = pd.read_csv(zf.open("fact_event.csv"))
+            assert len(fact) == 3
+
+    def test_parquet_archive(self, normalized_df):
+        tables = generate_star_schema(normalized_df)
+        zip_bytes = create_zip_archive(tables, format="parquet")
+        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+            assert "fact_event.parquet" in zf.namelist()
@@ -3,8 +3,11 @@ Column normalization utilities for handling case-insensitive
 and variant column name mappings.
 """
 
+import functools
 import re
-from typing import Dict, List, Tuple
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 import pandas as pd
 
 
@@ -22,82 +25,118 @@ COLUMN_ALIASES = {
     "indicateur principal": "Indicateur_principal",
 }
 
+# Interned canonical names (identity-based equality, cached hashes)
+# behind read-only proxies: these tables must never change after import
+CANONICAL_COLUMNS = MappingProxyType(
+    {key: sys.intern(value) for key, value in CANONICAL_COLUMNS.items()}
+)
+COLUMN_ALIASES = MappingProxyType(
+    {key: sys.intern(value) for key, value in COLUMN_ALIASES.items()}
+)
 
-def clean_column_name(name: str) -> str:
+# Combined lowercase -> canonical lookup; both source dicts share the
+# same shape, so one probe resolves either kind of match. Matching is
+# O(columns) with a single hash probe each, independent of alias count,
+# so the table can grow without touching normalize_columns.
+_COLUMN_LOOKUP = {**CANONICAL_COLUMNS, **COLUMN_ALIASES}
+
+# Shared empty result for the no-rename fast path
+_EMPTY_MAPPING = MappingProxyType({})
+
+
+# Compiled once; clean_column_name runs for every column of every upload
+_SEPARATOR_RE = re.compile(r'[\s\-]+')
+
+# Maps each whitespace/hyphen separator to an underscore in one C pass
+_SEPARATOR_TABLE = str.maketrans({c: "_" for c in " \t\n\r\v\f-"})
+
+
+@functools.lru_cache(maxsize=1024)
+def clean_column_name(name: str, _sub=_SEPARATOR_RE.sub) -> str:
     """
     Clean a column name by trimming whitespace and normalizing
     separators (replace spaces and hyphens with underscores).
-    
+
+    Results are memoized: repeat uploads of the same schema re-clean
+    the same handful of names.
+
     Args:
         name: Original column name
-        
+
     Returns:
         Cleaned column name
     """
-    # Trim whitespace
     cleaned = name.strip()
-    # Replace spaces and hyphens with underscores
-    cleaned = re.sub(r'[\s\-]+', '_', cleaned)
-    return cleaned
+    if not cleaned.isascii():
+        # The translate table only knows ASCII separators; let the regex
+        # handle Unicode whitespace (NBSP etc. from French Excel exports)
+        return _sub('_', cleaned)
+    translated = cleaned.translate(_SEPARATOR_TABLE)
+    if translated == cleaned:
+        # No separators present
+        return cleaned
+    if "__" not in translated:
+        return translated
+    # Adjacent separators must collapse into a single underscore
+    return _sub('_', cleaned)
 
 
-def normalize_columns(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, str]]:
+def normalize_columns(df: pd.DataFrame) -> Tuple[pd.DataFrame, Mapping[str, str]]:
     """
     Normalize DataFrame column names to canonical format.
-    
+
     Performs case-insensitive matching for required columns
     and cleans up separators in all column names.
-    
+
     Args:
         df: Input DataFrame
-        
+
     Returns:
-        Tuple of (normalized DataFrame, mapping dict of original->new names)
+        Tuple of (normalized DataFrame, read-only mapping of original->new names)
     """
-    rename_mapping = {}
-    columns_applied = {}
-    
-    # First pass: clean all column names
-    for col in df.columns:
-        cleaned = clean_column_name(col)
-        if cleaned != col:
-            rename_mapping[col] = cleaned
-    
-    # Apply initial cleaning
-    if rename_mapping:
-        df = df.rename(columns=rename_mapping)
-        columns_applied.update(rename_mapping)
-        rename_mapping = {}
-    
-    # Second pass: case-insensitive matching for canonical columns
-    cols_lower = {col.lower(): col for col in df.columns}
-    
-    for canonical_lower, canonical_name in CANONICAL_COLUMNS.items():
-        # Skip if canonical name already exists
-        if canonical_name in df.columns:
-            continue
-        
-        # Check for case-insensitive match
-        if canonical_lower in cols_lower:
-            original_col = cols_lower[canonical_lower]
-            if original_col != canonical_name:
-                rename_mapping[original_col] = canonical_name
-    
-    # Also check aliases
-    for alias_lower, canonical_name in COLUMN_ALIASES.items():
-        if canonical_name in df.columns:
-            continue
-        if alias_lower in cols_lower:
-            original_col = cols_lower[alias_lower]
-            if original_col != canonical_name and original_col not in rename_mapping:
-                rename_mapping[original_col] = canonical_name
-    
-    # Apply canonical renaming
-    if rename_mapping:
-        df = df.rename(columns=rename_mapping)
-        columns_applied.update(rename_mapping)
-    
-    return df, columns_applied
+    # Fast path: repeat uploads usually arrive already canonical, in which
+    # case no lists, sets or mapping need to be built at all
+    if all(
+        clean_column_name(col) == col and _COLUMN_LOOKUP.get(col.lower(), col) == col
+        for col in df.columns
+    ):
+        return df, _EMPTY_MAPPING
+
+    # Single pass: clean each name, then resolve it against the canonical
+    # and alias tables to get its final form
+    cleaned_names = [clean_column_name(col) for col in df.columns]
+    lowered_names = [cleaned.lower() for cleaned in cleaned_names]
+    present = set(cleaned_names)
+
+    # assigned_targets is the reverse index of renames already decided:
+    # one O(1) probe guards against two columns claiming the same target
+    final_names = []
+    assigned_targets = set()
+    for cleaned, lowered in zip(cleaned_names, lowered_names):
+        canonical = _COLUMN_LOOKUP.get(lowered)
+        if (
+            canonical is not None
+            and canonical != cleaned
+            and canonical not in present
+            and canonical not in assigned_targets
+        ):
+            final_names.append(canonical)
+            assigned_targets.add(canonical)
+        else:
+            final_names.append(cleaned)
+
+    columns_applied = {
+        original: new for original, new in zip(df.columns, final_names) if original != new
+    }
+
+    if columns_applied:
+        # set_axis swaps the whole Index at once, skipping rename's
+        # per-key dict dispatch; under copy-on-write no data is copied
+        df = df.set_axis(final_names, axis=1)
+
+    # Callers only read the mapping (display / membership checks), so hand
+    # out a read-only view instead of letting them mutate internal state
+    return df, MappingProxyType(columns_applied)
 
 
 def get_missing_required_columns(df: pd.DataFrame, required: List[str]) -> List[str]:
@@ -111,16 +150,9 @@ def get_missing_required_columns(df: pd.DataFrame, required: List[str]) -> List[
     Returns:
         List of missing column names
     """
+    # An exact match implies a lowercase match, so one set probe suffices
     df_cols_lower = {col.lower() for col in df.columns}
-    missing = []
-    
-    for req in required:
-        if req not in df.columns:
-            # Also check case-insensitive
-            if req.lower() not in df_cols_lower:
-                missing.append(req)
-    
-    return missing
+    return [req for req in required if req.lower() not in df_cols_lower]
 
 
 def format_column_mapping_message(mapping: Dict[str, str]) -> str:
@@ -135,6 +167,7 @@ def format_column_mapping_message(mapping: Dict[str, str]) -> str:
     """
     if not mapping:
         return ""
-    
-    lines = [f"`{orig}` → `{new}`" for orig, new in mapping.items()]
-    return "**Colonnes auto-mappées :** " + ", ".join(lines)
+
+    return "**Colonnes auto-mappées :** " + ", ".join(
+        f"`{orig}` → `{new}`" for orig, new in mapping.items()
+    )
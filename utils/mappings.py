@@ -1,5 +1,13 @@
 # Mapping constants for data normalization
 
+import re
+import sys
+import unicodedata
+from enum import IntEnum
+from types import MappingProxyType
+
+import pandas as pd
+
 # Event type mapping from Indicateur_principal to standardized event types
 EVENT_TYPE_MAPPING = {
     "identification": "IDENTIFICATION",
@@ -10,20 +18,64 @@ EVENT_TYPE_MAPPING = {
     "suppression_lien": "LINK_DELETED",
 }
 
-# Response code normalization (handles accents and variants)
-RESPONSE_CODE_MAPPING = {
+# Interned event type codes (cached hashes, pointer-identity equality)
+# behind a read-only proxy: the table must never change after import
+EVENT_TYPE_MAPPING = MappingProxyType(
+    {key: sys.intern(value) for key, value in EVENT_TYPE_MAPPING.items()}
+)
+
+# Canonical response code spellings; accent and separator variants are
+# derived below rather than hand-enumerated
+_RESPONSE_CODE_BASE = {
     "peut-être": "PEUT_ETRE",
-    "peut-etre": "PEUT_ETRE",
-    "peut etre": "PEUT_ETRE",
-    "peutetre": "PEUT_ETRE",
     "association": "ASSOCIATION",
     "refus": "REFUS",
     "close": "CLOSE",
     "fermer": "CLOSE",
 }
 
+
+def _expand_response_variants(base: dict) -> dict:
+    """Derive accent-folded and separator-free variants for each key."""
+    expanded = {}
+    for key, code in base.items():
+        folded = unicodedata.normalize("NFKD", key).encode("ascii", "ignore").decode("ascii")
+        for variant in (key, folded, folded.replace("-", " "), folded.replace("-", "")):
+            expanded.setdefault(variant, sys.intern(code))
+    return expanded
+
+
+# Response code normalization (handles accents and variants), read-only
+RESPONSE_CODE_MAPPING = MappingProxyType(_expand_response_variants(_RESPONSE_CODE_BASE))
+
+class EventTypeCode(IntEnum):
+    """Integer codes for event types, aligned with the dim_event_type IDs."""
+    IDENTIFICATION = 1
+    POPIN_DISPLAYED = 2
+    POPIN_RESPONSE = 3
+    LINK_CREATED = 4
+    LINK_VALIDATED = 5
+    LINK_DELETED = 6
+    OTHER = 7
+
+
+class ResponseCode(IntEnum):
+    """Integer codes for response codes, aligned with the dim_response IDs."""
+    ASSOCIATION = 1
+    PEUT_ETRE = 2
+    REFUS = 3
+    CLOSE = 4
+
+
+class UniverseCode(IntEnum):
+    """Integer codes for universes, aligned with the dim_universe IDs."""
+    LBP = 1
+    LP = 2
+    LPM = 3
+
+
 # Valid universe values
-VALID_UNIVERSES = frozenset({"LBP", "LP", "LPM"})
+VALID_UNIVERSES = frozenset(UniverseCode.__members__)
 
 # Auto-detection candidates for measure columns
 MEASURE_COLUMN_CANDIDATES = ["valeur", "value", "count", "nb", "volume", "nombre", "qty", "quantity"]
@@ -31,26 +83,26 @@ MEASURE_COLUMN_CANDIDATES = ["valeur", "value", "count", "nb", "volume", "nombre
 # Auto-detection candidates for date columns
 DATE_COLUMN_CANDIDATES = ["date", "periode", "period", "event_date", "jour", "day", "mois", "month"]
 
+# Compiled alternations over the candidate lists: one C-level regex scan
+# per column name instead of a Python substring check per candidate
+MEASURE_COLUMN_RE = re.compile("|".join(map(re.escape, MEASURE_COLUMN_CANDIDATES)))
+DATE_COLUMN_RE = re.compile("|".join(map(re.escape, DATE_COLUMN_CANDIDATES)))
+
 # Event type enum values
-EVENT_TYPES = frozenset({
-    "IDENTIFICATION",
-    "POPIN_DISPLAYED",
-    "POPIN_RESPONSE",
-    "LINK_CREATED",
-    "LINK_VALIDATED",
-    "LINK_DELETED",
-    "OTHER",
-})
+EVENT_TYPES = frozenset(EventTypeCode.__members__)
 
 # Response code enum values
-RESPONSE_CODES = frozenset({
-    "ASSOCIATION",
-    "PEUT_ETRE",
-    "REFUS",
-    "CLOSE",
-})
+RESPONSE_CODES = frozenset(ResponseCode.__members__)
 
 # Quality flag values
 QUALITY_OK = "OK"
 QUALITY_WARNING = "WARNING"
 QUALITY_ERROR = "ERROR"
+
+# Pre-built pandas views of the enums: the Index gives C-level hashtable
+# membership for Series.isin, the dtypes let consumers cast straight to
+# a fixed category set
+VALID_UNIVERSES_INDEX = pd.Index(sorted(VALID_UNIVERSES))
+VALID_UNIVERSES_DTYPE = pd.CategoricalDtype(sorted(VALID_UNIVERSES))
+EVENT_TYPES_DTYPE = pd.CategoricalDtype(sorted(EVENT_TYPES))
+RESPONSE_CODES_DTYPE = pd.CategoricalDtype(sorted(RESPONSE_CODES))